@@ -1 +1,19 @@
+# same names as `pywhispercpp._version.__all__`, listed here so that importing the package does not load it
+_VERSION_ATTRS = frozenset((
+    "__version__",
+    "__version_tuple__",
+    "version",
+    "version_tuple",
+    "__commit_id__",
+    "commit_id",
+))
 
+
+def __getattr__(name):
+    # the version attributes are resolved on first access, see `pywhispercpp._version`
+    if name in _VERSION_ATTRS:
+        from pywhispercpp import _version
+
+        value = globals()[name] = getattr(_version, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
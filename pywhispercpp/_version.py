@@ -0,0 +1,140 @@
+"""Runtime helpers for exposing the package version.
+
+Builds write the version literals (including the parsed version tuple)
+to ``_generated_version.py`` through setuptools-scm (see
+``[tool.setuptools_scm]`` in pyproject.toml), so an installed package
+never has to query importlib.metadata or parse the version string. The
+metadata lookup and the parsers are only kept as a fallback for source
+trees that were never built.
+
+The version is resolved lazily (PEP 562) on first attribute access, so a
+plain import of the package never pays for the metadata lookup. The
+modules only needed by the fallbacks (importlib.metadata, re) are
+imported there, this module itself only uses already loaded ones.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+
+__all__ = [
+    "__version__",
+    "__version_tuple__",
+    "version",
+    "version_tuple",
+    "__commit_id__",
+    "commit_id",
+]
+
+_PACKAGE_NAME = "pywhispercpp"
+
+_LAZY_ATTRS = frozenset(__all__)
+
+# setuptools-scm encodes the git node as `g<short sha>` in the local version
+_COMMIT_PATTERN = r"\bg[0-9a-f]{7,}\b"
+_SEPARATOR_PATTERN = r"[.+]"
+
+
+@lru_cache(maxsize=1)
+def _generated():
+    try:
+        from pywhispercpp import _generated_version
+    except ImportError:
+        return None
+    return _generated_version
+
+
+def _read_dist_info_version(site_dir: str):
+    # the dist-info directory of a regular install sits next to the package,
+    # reading its `Version:` header is much cheaper than metadata.version()
+    try:
+        names = os.listdir(site_dir)
+    except OSError:
+        return None
+    for name in names:
+        if not (name.startswith(f"{_PACKAGE_NAME}-") and name.endswith(".dist-info")):
+            continue
+        try:
+            file = open(os.path.join(site_dir, name, "METADATA"), encoding="utf-8")
+        except OSError:
+            continue
+        with file:
+            for line in file:
+                if line.startswith("Version:"):
+                    return line[8:].strip()
+                if not line.strip():
+                    # end of the headers
+                    break
+    return None
+
+
+@lru_cache(maxsize=1)
+def _read_version() -> str:
+    generated = getattr(_generated(), "__version__", None)
+    if generated:
+        return generated
+    site_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    dist_info_version = _read_dist_info_version(site_dir)
+    if dist_info_version:
+        return dist_info_version
+    if os.path.isfile(os.path.join(site_dir, "setup.py")):
+        # a source checkout that was never built (building writes the generated file),
+        # skip the metadata lookup that would scan all of sys.path just to fail
+        return "0.0.0"
+    from importlib import metadata
+
+    try:
+        return metadata.version(_PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return "0.0.0"
+
+
+@lru_cache(maxsize=4)
+def _version_tuple(ver: str) -> tuple:
+    import re
+
+    tokens = [t for t in re.split(_SEPARATOR_PATTERN, ver) if t]
+    if all(t.isdecimal() for t in tokens):
+        # plain release versions, e.g. 1.3.1
+        return tuple(map(int, tokens))
+    # textual tokens live as long as the process, share them with other interned copies
+    return tuple(int(t) if t.isdecimal() else sys.intern(t) for t in tokens)
+
+
+@lru_cache(maxsize=4)
+def _commit_id(ver: str) -> str:
+    _, sep, local = ver.partition("+")
+    if not sep:
+        return ""
+    import re
+
+    match = re.search(_COMMIT_PATTERN, local)
+    return match.group(0) if match else ""
+
+
+def __getattr__(name: str):
+    # only compute what is asked for, e.g. reading __version__ never parses the commit id
+    if name in ("version", "__version__"):
+        value = _read_version()
+    elif name in ("version_tuple", "__version_tuple__"):
+        value = getattr(_generated(), "__version_tuple__", None) or _version_tuple(_read_version())
+    elif name in ("commit_id", "__commit_id__"):
+        # older setuptools-scm templates do not write __commit_id__
+        value = getattr(_generated(), "__commit_id__", None)
+        if not value:
+            ver = _read_version()
+            # release versions have no local segment, so there is nothing to parse
+            value = _commit_id(ver) if "+" in ver else ""
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache both aliases in the module namespace so later lookups never reach __getattr__
+    alias = name.strip("_")
+    module_globals = globals()
+    module_globals[alias] = module_globals[f"__{alias}__"] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | _LAZY_ATTRS)
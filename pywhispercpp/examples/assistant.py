@@ -7,7 +7,6 @@ The idea is to use a `VAD` to detect speech (in this example we used webrtcvad),
 we run the inference.
 """
 import argparse
-import importlib.metadata
 import queue
 import time
 from typing import Callable
@@ -18,7 +17,7 @@ import webrtcvad
 import logging
 from pywhispercpp.model import Model
 
-__version__ = importlib.metadata.version('pywhispercpp')
+from pywhispercpp import __version__
 
 __header__ = f"""
 =====================================
@@ -1,50 +1,41 @@
+import re
 import sys
-import threading
+import time
+from collections import deque, namedtuple
 from datetime import datetime
+from functools import lru_cache
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QFileDialog, QProgressBar, QLabel, QFrame,
-    QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView,
+    QSizePolicy, QTableView, QHeaderView,
     QGroupBox, QFormLayout, QComboBox, QLineEdit, QCheckBox,
     QSpinBox, QDoubleSpinBox, QToolButton, QDialog, QMenu  # Import QMenu
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QObject, QThread, QTimer, QAbstractTableModel, QModelIndex
+)
+from PyQt5 import sip
 import os
-import importlib.metadata
+import importlib.util
 
-__version__ = importlib.metadata.version('pywhispercpp')
+from pywhispercpp import __version__
 
-from pywhispercpp.model import Model, Segment
-from pywhispercpp.utils import output_txt, output_srt, output_vtt, output_csv  # Import utilities
+# `pywhispercpp.model` (which loads the whisper.cpp extension) and `pywhispercpp.utils` are imported
+# where they are needed, so the window shows up without waiting for them
 
 
 # --- Available Models ---
-# Define a custom order for model sizes
-MODEL_SIZE_ORDER = {"tiny": 0, "base": 1, "small": 2, "medium": 3, "large": 4}
-
-UNSORTED_MODELS = [
-    "base", "base-q5_1", "base-q8_0", "base.en", "base.en-q5_1",
-    "base.en-q8_0", "large-v1", "large-v2", "large-v2-q5_0",
-    "large-v2-q8_0", "large-v3", "large-v3-q5_0", "large-v3-turbo",
-    "large-v3-turbo-q5_0", "large-v3-turbo-q8_0", "medium",
-    "medium-q5_0", "medium-q8_0", "medium.en", "medium.en-q5_0",
-    "medium.en-q8_0", "small", "small-q5_1", "small-q8_0", "small.en",
-    "small.en-q5_1", "small.en-q8_0", "tiny", "tiny-q5_1", "tiny-q8_0",
-    "tiny.en", "tiny.en-q5_1", "tiny.en-q8_0",
-]
-
-
-# Custom sort key function
-def get_model_sort_key(model_name):
-    # Extract the base model name (e.g., "tiny.en" -> "tiny", "large-v3-turbo" -> "large")
-    base_name = model_name.split('.')[0].split('-')[0]
-    # Return a tuple for multi-level sorting: (size_order, full_model_name_for_secondary_sort)
-    return (MODEL_SIZE_ORDER.get(base_name, 99), model_name)  # 99 for any unexpected names
-
-
-# Sort the models
-AVAILABLE_MODELS = sorted(UNSORTED_MODELS, key=get_model_sort_key)
+# Ordered by model size (tiny, base, small, medium, large), then by name.
+# Kept as a literal so that the GUI does not have to sort the list at import time.
+AVAILABLE_MODELS = (
+    "tiny", "tiny-q5_1", "tiny-q8_0", "tiny.en", "tiny.en-q5_1", "tiny.en-q8_0",
+    "base", "base-q5_1", "base-q8_0", "base.en", "base.en-q5_1", "base.en-q8_0",
+    "small", "small-q5_1", "small-q8_0", "small.en", "small.en-q5_1", "small.en-q8_0",
+    "medium", "medium-q5_0", "medium-q8_0", "medium.en", "medium.en-q5_0", "medium.en-q8_0",
+    "large-v1", "large-v2", "large-v2-q5_0", "large-v2-q8_0", "large-v3", "large-v3-q5_0",
+    "large-v3-turbo", "large-v3-turbo-q5_0", "large-v3-turbo-q8_0",
+)
 
 # --- Retouched Minimal Stylesheet ---
 STYLESHEET = """
@@ -149,15 +140,15 @@ QToolButton::menu-indicator {
     image: none; /* Hide default menu indicator */
 }
 
-/* Table Widget */
-QTableWidget {
+/* Table View */
+QTableView {
     background-color: #ffffff;
     border: 1px solid #d0d0d0; /* Slightly softer border */
     gridline-color: #e8e8e8; /* Very light grid lines */
     border-radius: 3px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 4px;
     border-bottom: 1px solid #f5f5f5; /* Match general background for subtle row separation */
 }
@@ -230,6 +221,77 @@ QLabel#status_bar_label {
     font-size: 13px; /* Slightly smaller font */
 }
 """
+# Strip the comments once, so Qt has less to parse
+STYLESHEET = re.sub(r"\s*/\*.*?\*/", "", STYLESHEET, flags=re.DOTALL)
+
+
+@lru_cache(maxsize=8192)
+def format_time(milliseconds):
+    """Converts milliseconds to HH:MM:SS.ms format."""
+    hours, rest = divmod(int(milliseconds), 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, milliseconds = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+# Plain tuple carrying what the GUI needs from a `pywhispercpp.model.Segment`,
+# cheap to hand over between threads and still usable with the `pywhispercpp.utils` output functions
+SegmentRow = namedtuple("SegmentRow", ("t0", "t1", "text"))
+
+
+# --- Table Model for the Transcription Output ---
+class SegmentTableModel(QAbstractTableModel):
+    """
+    Exposes the transcribed segments to a `QTableView`.
+    Cells are computed on demand, so no item object is allocated per cell.
+    Segment texts come already stripped from `Model`, they are displayed as is.
+    """
+    HEADERS = ("Start Time", "End Time", "Text")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._segments = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._segments)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        segment = self._segments[index.row()]
+        column = index.column()
+        # whisper.cpp timestamps are in units of 10 ms
+        if column == 0:
+            return format_time(segment.t0 * 10)
+        if column == 1:
+            return format_time(segment.t1 * 10)
+        return segment.text
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def append_segments(self, segments):
+        """Appends a batch of segments with a single row insertion."""
+        if not segments:
+            return
+        first_row = len(self._segments)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(segments) - 1)
+        self._segments.extend(segments)
+        self.endInsertRows()
+
+    def set_segments(self, segments):
+        """Replaces all the rows at once, with a single model reset."""
+        self.beginResetModel()
+        self._segments = list(segments)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_segments([])
 
 
 # --- Communication Object for Threading ---
@@ -239,79 +301,130 @@ class WorkerSignals(QObject):
     Supported signals are:
     - finished: No data
     - error: tuple (exctype, value, traceback.format_exc())
-    - result: list (the transcribed segments)
+    - result: list (the transcribed segments, as `SegmentRow`)
     - progress: int (0-100)
     - status_update: str
+    New segments are not signaled one by one, they are queued on the worker (see `PyWhisperCppWorker.segment_queue`).
     """
     finished = pyqtSignal()
     error = pyqtSignal(tuple)
-    segment = pyqtSignal(Segment)
     result = pyqtSignal(list)
     progress = pyqtSignal(int)
     status_update = pyqtSignal(str)
 
 
-# --- Worker Thread for Transcription ---
-class PyWhisperCppWorker(threading.Thread):
+# --- Worker for Transcription, moved to a QThread ---
+class PyWhisperCppWorker(QObject):
 
-    def __init__(self, audio_file_path, model_name, **transcribe_params):
+    def __init__(self, audio_file_path, model_name, model_init_params, transcribe_params):
+        """
+        :param audio_file_path: media file to transcribe
+        :param model_name: name of the model, passed to `Model`
+        :param model_init_params: keyword arguments for `Model`
+        :param transcribe_params: keyword arguments for `Model.transcribe`
+        """
         super().__init__()
         self.audio_file_path = audio_file_path
         self.model_name = model_name
+        # Only read, never modified by the worker
+        self.model_init_params = model_init_params
         self.transcribe_params = transcribe_params
         self.signals = WorkerSignals()
-        self._is_running = False
+        # New segments (as `SegmentRow`), appended by the worker and drained by the GUI thread
+        self.segment_queue = deque()
+        # Last emitted progress, to drop duplicate and too frequent updates
+        self._last_progress = -1
+        self._last_progress_t = 0.0
 
+    @pyqtSlot()
     def run(self):
         """
-        Executes the transcription process.
+        Executes the transcription process, in the thread the worker was moved to.
         """
+        thread = self.thread()
         try:
-            self._is_running = True
             self.signals.status_update.emit(f"Loading model: {self.model_name}...")
 
-            # pywhispercpp will download the specified model if not found
-            model_init_params = {}
-            if 'n_threads' in self.transcribe_params and self.transcribe_params['n_threads'] is not None:
-                model_init_params['n_threads'] = self.transcribe_params['n_threads']
-                # Remove from transcribe_params as it's a model init param
-                del self.transcribe_params['n_threads']
+            from pywhispercpp.model import Model
 
-            model = Model(self.model_name, **model_init_params)
+            # pywhispercpp will download the specified model if not found
+            model = Model(self.model_name, **self.model_init_params)
+            # Loading (or downloading) the model cannot be interrupted, stop before transcribing instead
+            if thread.isInterruptionRequested():
+                raise RuntimeError("Transcription manually stopped")
 
             self.signals.status_update.emit("Model loaded. Starting transcription...")
 
+            # The bindings release the GIL for the whole whisper_full() call, so the GUI thread keeps running.
+            # Callbacks re-acquire it from the inference thread, keep them short (just queue the data).
             def new_segment_callback(segment):
-                if not self._is_running:
+                if thread.isInterruptionRequested():
                     raise RuntimeError("Transcription manually stopped")
-                self.signals.segment.emit(segment)
+                self.segment_queue.append(SegmentRow(segment.t0, segment.t1, segment.text))
 
             segments = model.transcribe(self.audio_file_path,
                                         new_segment_callback=new_segment_callback,
-                                        progress_callback=lambda progress: self.signals.progress.emit(progress),
+                                        progress_callback=self._on_progress,
                                         **self.transcribe_params)
 
             self.signals.status_update.emit("Transcription complete!")
-            self.signals.result.emit(segments)
+            self.signals.result.emit([SegmentRow(segment.t0, segment.t1, segment.text) for segment in segments])
 
         except Exception as e:
             print(e)
             self.signals.status_update.emit(f"Error: {str(e)}")
             self.signals.error.emit((type(e), e, str(e)))
         finally:
-            self._is_running = False
             self.signals.finished.emit()
 
+    def _on_progress(self, progress):
+        """Forwards whisper.cpp progress to the GUI, at most every 50 ms and only when it changed."""
+        # Also checked here, long stretches of audio without speech produce no segment
+        if self.thread().isInterruptionRequested():
+            raise RuntimeError("Transcription manually stopped")
+        now = time.monotonic()
+        if progress == self._last_progress:
+            return
+        if progress < 100 and now - self._last_progress_t < 0.05:
+            return
+        self._last_progress = progress
+        self._last_progress_t = now
+        self.signals.progress.emit(progress)
+
     def stop(self):
-        self._is_running = False
+        self.thread().requestInterruption()
 
 
 # --- Main Application Window ---
 class TranscriptionApp(QWidget):
+    # File dialog settings, shared by every dialog (default options keep the faster native dialogs)
+    _DIALOG_OPTIONS = QFileDialog.Options()
+    _FILE_FILTERS = {
+        "txt": "Plain Text Files (*.txt)",
+        "srt": "SRT Subtitle Files (*.srt)",
+        "vtt": "VTT Subtitle Files (*.vtt)",
+        "csv": "CSV (Comma Separated Values) Files (*.csv)",
+    }
+    # Content of the About dialog, nothing in it changes while the app runs
+    _ABOUT_TEXT = (
+        "<b>PyWhisperCPP Simple GUI</b><br>"
+        "Version {version}<br>"
+        "<br>"
+        "A simple graphical user interface for PyWhisperCpp Using PyQt.<br><br>"
+        "<a href='https://github.com/absadiki/pywhispercpp'>PyWhisperCpp GitHub repository</a><br>"
+        "<br>"
+        "Copyright © {year}"
+    ).format(version=__version__, year=datetime.now().year)
+    # How long quitting the application waits for a running transcription to stop
+    _STOP_TIMEOUT_MS = 3000
+
     def __init__(self):
         super().__init__()
         self.selected_file_path = None
         self.whisper_thread = None
+        self.whisper_worker = None
+        # Set once the window was closed during a transcription, it closes for real when the thread is done
+        self._closing = False
         # Settings widgets
         self.model_combo = None
         self.language_input = None
@@ -323,8 +436,14 @@ class TranscriptionApp(QWidget):
         self.toggle_settings_button = None  # Button to toggle settings
         self.status_bar_label = None  # New label for the status bar
         self.about_button = None  # About button
+        self._about_dialog = None  # About dialog, built on first use
         self.segments = []  # Store segments for export
+        self._transcript_text = None  # Plain text of `self.segments`, built on first use
         self.copy_text_button = None  # New button for copy text
+        # Drains the worker's segment queue into the results table in batches
+        self._segment_flush_timer = QTimer(self)
+        self._segment_flush_timer.setInterval(100)
+        self._segment_flush_timer.timeout.connect(self._flush_segments)
 
         self.initUI()
 
@@ -334,8 +453,7 @@ class TranscriptionApp(QWidget):
         """
         self.setWindowTitle('PyWhisperCpp Simple GUI')
         self.setGeometry(100, 100, 450, 500)
-        # Apply the updated stylesheet
-        self.setStyleSheet(STYLESHEET)
+        # The stylesheet is applied once on the QApplication, see `_main`
 
         # Main vertical layout
         main_layout = QVBoxLayout()
@@ -477,9 +595,9 @@ class TranscriptionApp(QWidget):
         output_label = QLabel("Transcription Output:")
         main_layout.addWidget(output_label)
 
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(3)
-        self.results_table.setHorizontalHeaderLabels(["Start Time", "End Time", "Text"])
+        self.results_model = SegmentTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         header = self.results_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -539,17 +657,16 @@ class TranscriptionApp(QWidget):
         """
         Opens a file dialog to select an audio file.
         """
-        options = QFileDialog.Options()
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select a Media File", "",
             "All Files (*)",
-            options=options
+            options=self._DIALOG_OPTIONS
         )
         if file_path:
             self.selected_file_path = file_path
             self.file_label.setText(f"Selected: {os.path.basename(file_path)}")
             self.transcribe_button.setEnabled(True)
-            self.results_table.setRowCount(0)
+            self.results_model.clear()
             self.export_button.setEnabled(False)  # Disable export until transcription
             self.copy_text_button.setEnabled(False)  # Disable copy until transcription
             self.update_status("File selected: " + os.path.basename(file_path))  # Update new status bar
@@ -564,41 +681,54 @@ class TranscriptionApp(QWidget):
             self.select_button.setEnabled(False)
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
-            self.results_table.setRowCount(0)
+            self.results_model.clear()
             self.export_button.setEnabled(False)  # Disable export during transcription
             self.copy_text_button.setEnabled(False)  # Disable copy during transcription
             self.update_status("Starting transcription...")
             self.segments = []  # Clear segments for new transcription
+            self._transcript_text = None
 
             # Gather settings from GUI widgets
             selected_model = self.model_combo.currentText()
+            # n_threads is a model init param, the rest is passed to transcribe
+            model_init_params = {"n_threads": self.n_threads_spinbox.value()}
             transcribe_params = {
-                "language": self.language_input.text() if self.language_input.text() else None,
                 "translate": self.translate_checkbox.isChecked(),
-                "n_threads": self.n_threads_spinbox.value(),
                 "no_context": self.no_context_checkbox.isChecked(),
                 "temperature": self.temperature_spinbox.value(),
             }
-            # Remove None values to use pywhispercpp defaults where applicable
-            transcribe_params = {k: v for k, v in transcribe_params.items() if v is not None}
+            # Leave the language out to use the pywhispercpp default (auto-detect)
+            language = self.language_input.text()
+            if language:
+                transcribe_params["language"] = language
 
-            # Create and start the worker thread
-            self.whisper_thread = PyWhisperCppWorker(
+            # Create the worker and move it to its own thread
+            self.whisper_worker = PyWhisperCppWorker(
                 self.selected_file_path,
                 selected_model,
-                **transcribe_params
+                model_init_params,
+                transcribe_params
             )
-            self.whisper_thread.signals.result.connect(self.on_transcription_result)
-            self.whisper_thread.signals.segment.connect(self.on_new_segment)
-            self.whisper_thread.signals.finished.connect(self.on_transcription_finished)
-            self.whisper_thread.signals.error.connect(self.on_transcription_error)
-            self.whisper_thread.signals.progress.connect(self.update_progress)
-            self.whisper_thread.signals.status_update.connect(self.update_status)
+            # Parented to the window, which stops it before being destroyed (see `_stop_transcription_thread`)
+            self.whisper_thread = QThread(self)
+            self.whisper_worker.moveToThread(self.whisper_thread)
+            self.whisper_thread.started.connect(self.whisper_worker.run)
+            self.whisper_worker.signals.finished.connect(self.whisper_thread.quit)
+            # Both are deleted by Qt once the thread is done, the worker from its own thread
+            self.whisper_thread.finished.connect(self.whisper_worker.deleteLater)
+            self.whisper_thread.finished.connect(self.whisper_thread.deleteLater)
+
+            self.whisper_worker.signals.result.connect(self.on_transcription_result)
+            self.whisper_worker.signals.finished.connect(self.on_transcription_finished)
+            self.whisper_worker.signals.error.connect(self.on_transcription_error)
+            self.whisper_worker.signals.progress.connect(self.update_progress)
+            self.whisper_worker.signals.status_update.connect(self.update_status)
             self.whisper_thread.start()
+            self._segment_flush_timer.start()
 
     def stop_transcription(self):
-        if self.whisper_thread:
-            self.whisper_thread.stop()
+        if self.whisper_worker:
+            self.whisper_worker.stop()
             # self.transcribe_button.setVisible(True)
             # self.stop_button.setVisible(False)
             # self.select_button.setEnabled(True)
@@ -606,6 +736,8 @@ class TranscriptionApp(QWidget):
             # self.on_transcription_finished()
 
     def update_progress(self, value):
+        if value == self.progress_bar.value():
+            return
         self.progress_bar.setValue(value)
         # Update status bar with progress if not already showing a specific message
         if not self.status_bar_label.text().startswith("Error:") and \
@@ -617,38 +749,35 @@ class TranscriptionApp(QWidget):
     def update_status(self, status_text):
         # Update the new status bar label directly
         if self.status_bar_label:
+            # setText repaints the label by itself, the style does not depend on the text
             self.status_bar_label.setText(status_text)
-            # Polish stylesheet for status_bar_label to ensure updates are reflected
-            self.status_bar_label.style().unpolish(self.status_bar_label)
-            self.status_bar_label.style().polish(self.status_bar_label)
-
-    def format_time(self, milliseconds):
-        """Converts milliseconds to HH:MM:SS.ms format."""
-        seconds_total = milliseconds / 1000
-        minutes, seconds = divmod(seconds_total, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{int(hours):02d}:{int(minutes):02d}:{seconds:06.3f}"
-
-    def on_new_segment(self, segment):
-        row_position = self.results_table.rowCount()
-        self.results_table.insertRow(row_position)
-        start_time_str = self.format_time(segment.t0)
-        end_time_str = self.format_time(segment.t1)
-
-        start_item = QTableWidgetItem(start_time_str)
-        end_item = QTableWidgetItem(end_time_str)
-        text_item = QTableWidgetItem(segment.text.strip())
-
-        self.results_table.setItem(row_position, 0, start_item)
-        self.results_table.setItem(row_position, 1, end_item)
-        self.results_table.setItem(row_position, 2, text_item)
+
+    def _flush_segments(self):
+        """Adds the segments queued by the worker to the results table with a single layout pass."""
+        if self.whisper_worker is None:
+            return
+        queue = self.whisper_worker.segment_queue
+        pending = []
+        while queue:
+            pending.append(queue.popleft())
+        if not pending:
+            return
+
+        self.results_model.append_segments(pending)
+        self.segments.extend(pending)
+        self._transcript_text = None
 
     def on_transcription_result(self, segments):
         """
         Populates the results table with the transcription segments.
         Stores segments for export.
         """
+        self._flush_segments()  # Make sure no buffered segment is left behind
         self.segments = segments  # Store segments
+        self._transcript_text = None
+        # The table is normally filled while transcribing, rebuild it in one go if rows are missing
+        if self.results_model.rowCount() != len(segments):
+            self.results_model.set_segments(segments)
         self.export_button.setEnabled(True if segments else False)  # Enable export if segments exist
         self.copy_text_button.setEnabled(True if segments else False)  # Enable copy if segments exist
 
@@ -661,11 +790,42 @@ class TranscriptionApp(QWidget):
         self.stop_button.setVisible(False)
         self.select_button.setEnabled(True)
         self.progress_bar.setVisible(False)
-        if self.results_table.rowCount() == 0:
+        self._flush_segments()
+        self._segment_flush_timer.stop()
+        if self.results_model.rowCount() == 0:
             self.update_status("Finished. No transcription data.")
         else:
             self.update_status("Transcription finished successfully!")
         self.whisper_thread = None
+        self.whisper_worker = None
+
+    def _stop_transcription_thread(self):
+        """
+        Interrupts a running transcription and waits at most `_STOP_TIMEOUT_MS` for its thread.
+        Destroying a running QThread aborts the process, so a thread that did not stop in time (e.g. still loading
+        the model) is detached from the window and handed over to Qt, it is then left to the end of the process.
+        """
+        thread = self.whisper_thread
+        if thread is None:
+            return
+        # The worker stops at its next segment or progress update, then the thread leaves its event loop
+        thread.requestInterruption()
+        thread.quit()
+        if not thread.wait(self._STOP_TIMEOUT_MS):
+            thread.setParent(None)
+            sip.transferto(thread, None)
+
+    def closeEvent(self, event):
+        if self.whisper_thread is not None and self.whisper_thread.isRunning():
+            # Waiting for the worker here would freeze the window, hide it and close it again once the thread is done
+            self.hide()
+            if not self._closing:
+                self._closing = True
+                self.whisper_thread.requestInterruption()
+                self.whisper_thread.finished.connect(self.close)
+            event.ignore()
+            return
+        super().closeEvent(event)
 
     def on_transcription_error(self, err):
         """
@@ -684,53 +844,34 @@ class TranscriptionApp(QWidget):
             self.update_status("No transcription data to export.")
             return
 
-        file_dialog_filter = {
-            "txt": "Plain Text Files (*.txt)",
-            "srt": "SRT Subtitle Files (*.srt)",
-            "vtt": "VTT Subtitle Files (*.vtt)",
-            "csv": "CSV (Comma Separated Values) Files (*.csv)",
-        }
-
-        default_file_name = os.path.basename(self.selected_file_path).rsplit('.', 1)[
+        default_file_name = os.path.splitext(os.path.basename(self.selected_file_path))[
                                 0] + f".{format_type}" if self.selected_file_path else f"transcription.{format_type}"
 
-        options = QFileDialog.Options()
         file_path, _ = QFileDialog.getSaveFileName(
             self, f"Save Transcription as {format_type.upper()}",
             default_file_name,
-            file_dialog_filter.get(format_type, "All Files (*)"),
-            options=options
+            self._FILE_FILTERS.get(format_type, "All Files (*)"),
+            options=self._DIALOG_OPTIONS
         )
 
         if file_path:
             try:
                 # Use pywhispercpp.utils functions based on format_type
                 if format_type == "txt":
-                    # For TXT, we'll re-use the text from the table or segments
-                    all_text = []
-                    for segment in self.segments:
-                        all_text.append(segment.text.strip())
-                    output_txt_content = "\n".join(all_text)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(output_txt_content)
+                    # For TXT, we'll re-use the text shared with "Copy Text"
+                    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        f.write(self.get_transcript_text())
 
                 elif format_type == "srt":
-                    if output_srt:
-                        output_srt(self.segments, file_path)
-                    else:
-                        raise ImportError("pywhispercpp.utils.output_srt not available.")
+                    from pywhispercpp.utils import output_srt
+                    output_srt(self.segments, file_path)
                 elif format_type == "vtt":
-                    if output_vtt:
-                        output_vtt(self.segments, file_path)
-                    else:
-                        raise ImportError("pywhispercpp.utils.output_vtt not available.")
+                    from pywhispercpp.utils import output_vtt
+                    output_vtt(self.segments, file_path)
                 elif format_type == "csv":
-                    if output_csv:
-                        # For CSV, we need to pass a list of lists/tuples representing rows
-                        # pywhispercpp.utils.output_csv expects a list of segments and a file path
-                        output_csv(self.segments, file_path)
-                    else:
-                        raise ImportError("pywhispercpp.utils.output_csv not available.")
+                    from pywhispercpp.utils import output_csv
+                    # pywhispercpp.utils.output_csv expects a list of segments and a file path
+                    output_csv(self.segments, file_path)
 
                 self.update_status(f"Transcription successfully exported to {os.path.basename(file_path)}")
             except Exception as e:
@@ -738,6 +879,15 @@ class TranscriptionApp(QWidget):
         else:
             self.update_status("Export cancelled.")
 
+    def get_transcript_text(self):
+        """
+        Returns the text of all segments, one per line.
+        It is built once and reused until the segments change.
+        """
+        if self._transcript_text is None:
+            self._transcript_text = "\n".join(segment.text for segment in self.segments)
+        return self._transcript_text
+
     def copy_all_text_to_clipboard(self):
         """
         Concatenates all text from segments and copies it to the clipboard.
@@ -746,15 +896,17 @@ class TranscriptionApp(QWidget):
             self.update_status("No transcription data to copy.")
             return
 
-        all_text = []
-        for segment in self.segments:
-            all_text.append(segment.text.strip())
-
-        QApplication.clipboard().setText("\n".join(all_text))
+        QApplication.clipboard().setText(self.get_transcript_text())
         self.update_status("Text copied to clipboard!")
 
     def show_about_dialog(self):
         """Opens a small dialog with About information."""
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.exec_()
+
+    def _build_about_dialog(self) -> QDialog:
+        """Builds the About dialog, it is then reused every time it is opened."""
         about_dialog = QDialog(self)
         about_dialog.setWindowTitle("About PyWhisperCPP Simple GUI")
         about_dialog.setFixedSize(400, 220)
@@ -764,15 +916,7 @@ class TranscriptionApp(QWidget):
 
         info_text = QLabel()
         info_text.setTextFormat(Qt.RichText)
-        info_text.setText(
-            "<b>PyWhisperCPP Simple GUI</b><br>"
-            f"Version {__version__}<br>"
-            "<br>"
-            "A simple graphical user interface for PyWhisperCpp Using PyQt.<br><br>"
-            "<a href='https://github.com/absadiki/pywhispercpp'>PyWhisperCpp GitHub repository</a><br>"
-            "<br>"
-            f"Copyright © {datetime.now().year}"
-        )
+        info_text.setText(self._ABOUT_TEXT)
         info_text.setOpenExternalLinks(True)
 
         dialog_layout.addWidget(info_text)
@@ -781,19 +925,23 @@ class TranscriptionApp(QWidget):
         close_button.clicked.connect(about_dialog.accept)
         dialog_layout.addWidget(close_button, alignment=Qt.AlignCenter)
 
-        about_dialog.exec_()
+        return about_dialog
 
 
 def _main():
     """Main function to run the application."""
-    if Model is None:
+    # Only check that the bindings are there, they are loaded when a transcription starts
+    if importlib.util.find_spec("_pywhispercpp") is None:
         print("pywhispercpp is not installed.")
         print("Please install it by running: pip install pywhispercpp")
         print("You also need ffmpeg installed on your system.")
         return
 
     app = QApplication(sys.argv)
+    app.setStyleSheet(STYLESHEET)
     ex = TranscriptionApp()
+    # closeEvent is not sent when the application quits by other means
+    app.aboutToQuit.connect(ex._stop_transcription_thread)
     ex.show()
     sys.exit(app.exec_())
 
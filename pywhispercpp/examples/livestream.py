@@ -16,10 +16,9 @@ import numpy as np
 import pywhispercpp.constants as constants
 import sounddevice as sd
 from pywhispercpp.model import Model
-import importlib.metadata
 
 
-__version__ = importlib.metadata.version('pywhispercpp')
+from pywhispercpp import __version__
 
 __header__ = f"""
 ========================================================
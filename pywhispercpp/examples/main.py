@@ -5,12 +5,11 @@
 A simple Command Line Interface to test the package
 """
 import argparse
-import importlib.metadata
 import logging
 
 import pywhispercpp.constants as constants
 
-__version__ = importlib.metadata.version('pywhispercpp')
+from pywhispercpp import __version__
 
 __header__ = f"""
 PyWhisperCpp
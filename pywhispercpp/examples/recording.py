@@ -9,10 +9,9 @@ import logging
 import sounddevice as sd
 import pywhispercpp.constants
 from pywhispercpp.model import Model
-import importlib.metadata
 
 
-__version__ = importlib.metadata.version('pywhispercpp')
+from pywhispercpp import __version__
 
 __header__ = f"""
 ===================================================================
@@ -5,7 +5,6 @@
 This module contains a simple Python API on-top of the C-style
 [whisper.cpp](https://github.com/ggerganov/whisper.cpp) API.
 """
-import importlib.metadata
 import logging
 import shutil
 import sys
@@ -16,6 +15,7 @@ import _pywhispercpp as pw
 import numpy as np
 import pywhispercpp.utils as utils
 import pywhispercpp.constants as constants
+from pywhispercpp import __version__
 import subprocess
 import os
 import tempfile
@@ -24,7 +24,6 @@ import wave
 __author__ = "absadiki"
 __copyright__ = "Copyright 2023, "
 __license__ = "MIT"
-__version__ = importlib.metadata.version('pywhispercpp')
 
 logger = logging.getLogger(__name__)
 
@@ -4,15 +4,22 @@
 Helper functions
 """
 
+import atexit
 import contextlib
+import csv
+import hashlib
+import json
 import logging
 import os
+import re
+import shutil
 import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import TextIO
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, TextIO, Tuple
 
-import requests
-from tqdm import tqdm
 
 from pywhispercpp.constants import (
     AVAILABLE_MODELS,
@@ -21,9 +28,55 @@ from pywhispercpp.constants import (
     MODELS_PREFIX_URL,
 )
 
+if TYPE_CHECKING:
+    # only needed to download the models, they are imported there to keep this module cheap to import
+    import requests
+    from tqdm import tqdm
+
 logger = logging.getLogger(__name__)
 
+# Models are downloaded over several connections (HTTP range requests) when the server supports it
+PARALLEL_DOWNLOAD_CONNECTIONS = 8
+# Below this size a single connection is as fast
+PARALLEL_DOWNLOAD_MIN_SIZE = 16 * (1 << 20)
+# Attempts per range before giving up on the parallel download
+PARALLEL_DOWNLOAD_RETRIES = 3
+# Seconds between two saves of the progress of the ranges, which a resumed parallel download continues from
+PARALLEL_DOWNLOAD_SAVE_INTERVAL = 1.0
+
+_SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
+# subtitle blocks, filled with %-formatting which is the cheapest for a constant template
+_VTT_HEADER = "WEBVTT\n\n"
+_VTT_BLOCK = "%s --> %s\n%s\n\n"
+_SRT_BLOCK = "%d\n%s --> %s\n%s\n\n"
+
+# maps the model names to the `etag`, `size`, `sha256` and `path` of their downloaded file
+MODELS_INDEX_PATH = MODELS_DIR / '_index.json'
 
+
+@lru_cache(maxsize=1)
+def _session() -> 'requests.Session':
+    """
+    The HTTP session shared by all the downloads, created on first use
+    Connections (and their TLS handshakes) are reused across requests and models, transient connection failures
+    and gateway errors are retried before any of the download logic sees them
+
+    :return: the session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_maxsize=2 * PARALLEL_DOWNLOAD_CONNECTIONS,
+                                          max_retries=Retry(total=5, backoff_factor=0.3,
+                                                            status_forcelist=[502, 503, 504])))
+    atexit.register(session.close)
+    return session
+
+
+@lru_cache(maxsize=None)
 def _get_model_url(model_name: str) -> str:
     """
     Returns the url of the `ggml` model
@@ -33,15 +86,371 @@ def _get_model_url(model_name: str) -> str:
     return f"{MODELS_BASE_URL}/{MODELS_PREFIX_URL}-{model_name}.bin"
 
 
-def download_model(model_name: str, download_dir=None, chunk_size=1024) -> str:
+@lru_cache(maxsize=None)
+def _get_model_filename(model_name: str) -> str:
+    """
+    Returns the file name of the `ggml` model
+    :param model_name: name of the model
+    :return: file name of the model
+    """
+    return os.path.basename(_get_model_url(model_name))
+
+
+def _get_model_path(model_name: str, download_dir) -> Path:
+    """
+    Returns the local path of the `ggml` model
+    :param model_name: name of the model
+    :param download_dir: directory of the models, a relative one is resolved against the current working directory
+    :return: absolute path of the model file
+    """
+    return Path(download_dir).absolute() / _get_model_filename(model_name)
+
+
+def _fetch_range(url: str, file_path: Path, byte_range: List[int], progress_bar: 'tqdm', lock: threading.Lock,
+                 stop: threading.Event, chunk_size: int) -> None:
+    """
+    Downloads the bytes `byte_range` = [offset, end] (inclusive) of `url` into the same offsets of `file_path`
+    The offset is moved forward as the bytes are written, failed attempts are retried with an exponential backoff
+    resuming from it
+    Returns early once `stop` is set
+
+    :param url: URL of the file
+    :param file_path: pre-sized destination file
+    :param byte_range: first and last byte of the range, updated in place
+    :param progress_bar: shared progress bar
+    :param lock: lock guarding `progress_bar`
+    :param stop: event set when the download is aborted
+    :param chunk_size: size of the download chunk
+    :return: None
+    """
+    import requests
+
+    start, end = byte_range
+    with open(file_path, 'r+b') as file:
+        for attempt in range(PARALLEL_DOWNLOAD_RETRIES):
+            try:
+                resp = _session().get(url, headers={'Range': f'bytes={byte_range[0]}-{end}'}, stream=True, timeout=30)
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise requests.HTTPError(f"Range request not honored (HTTP {resp.status_code})", response=resp)
+                file.seek(byte_range[0])
+                for data in resp.iter_content(chunk_size=chunk_size):
+                    if stop.is_set():
+                        resp.close()
+                        return
+                    size = file.write(data)
+                    # the saved offset never runs ahead of the bytes handed to the OS
+                    file.flush()
+                    byte_range[0] += size
+                    with lock:
+                        progress_bar.update(size)
+                if byte_range[0] > end:
+                    return
+                logger.debug(f"Connection closed at byte {byte_range[0]} of range {start}-{end}")
+            except requests.RequestException as e:
+                if attempt == PARALLEL_DOWNLOAD_RETRIES - 1:
+                    raise
+                logger.debug(f"Range {start}-{end} failed at byte {byte_range[0]}: {e}")
+            if stop.wait(0.5 * 2 ** attempt):
+                return
+    raise IOError(f"Could not download bytes {start}-{end} of {url}")
+
+
+def _download_parallel(url: str, file_path: Path, total: int, progress_bar: 'tqdm', chunk_size: int,
+                       ranges: Optional[List[List[int]]] = None,
+                       save_ranges: Optional[Callable[[List[List[int]]], None]] = None) -> str:
+    """
+    Downloads `url` into `file_path` using `PARALLEL_DOWNLOAD_CONNECTIONS` concurrent range requests
+
+    :param url: URL of the file
+    :param file_path: destination file
+    :param total: size of the file in bytes
+    :param progress_bar: progress bar
+    :param chunk_size: size of the download chunk
+    :param ranges: [offset, end] of the ranges left by an interrupted download of `file_path`, None to start over
+    :param save_ranges: called with the progress of the ranges every `PARALLEL_DOWNLOAD_SAVE_INTERVAL` seconds
+        and when the download is interrupted
+    :return: sha256 hex digest of the downloaded file
+    """
+    if ranges is None:
+        # every worker writes its own range of the pre-sized file, reserved upfront to keep its blocks contiguous
+        with open(file_path, 'wb') as file:
+            try:
+                os.posix_fallocate(file.fileno(), 0, total)
+            except (AttributeError, OSError):
+                # not available on Windows/macOS or not supported by the filesystem
+                file.truncate(total)
+        range_size = -(-total // PARALLEL_DOWNLOAD_CONNECTIONS)
+        ranges = [[start, min(start + range_size, total) - 1] for start in range(0, total, range_size)]
+
+    def save():
+        if save_ranges is not None:
+            save_ranges([list(byte_range) for byte_range in ranges])
+
+    save()
+    lock = threading.Lock()
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max(len(ranges), 1))
+    try:
+        futures = [executor.submit(_fetch_range, url, file_path, byte_range, progress_bar, lock, stop, chunk_size)
+                   for byte_range in ranges]
+        not_done = futures
+        while not_done:
+            done, not_done = wait(not_done, timeout=PARALLEL_DOWNLOAD_SAVE_INTERVAL, return_when=FIRST_EXCEPTION)
+            for future in done:
+                # raises the error of a failed range
+                future.result()
+            if not_done:
+                save()
+    except BaseException as e:
+        # the other ranges stop at their next chunk instead of completing, the workers are still waited for
+        # before the file is downloaded again over a single connection, but not on a KeyboardInterrupt
+        stop.set()
+        executor.shutdown(wait=isinstance(e, Exception), cancel_futures=True)
+        save()
+        raise
+    executor.shutdown()
+    # the ranges arrive out of order, so the file can only be hashed once complete
+    return _hash_file(file_path).hexdigest()
+
+
+class _HashingWriter:
+    """
+    Write-only file wrapper hashing and reporting the progress of the data written through it
+    """
+
+    def __init__(self, file, digest: 'hashlib._Hash', progress_bar: 'tqdm'):
+        self.file = file
+        self.digest = digest
+        self.progress_bar = progress_bar
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        size = self.file.write(data)
+        self.size += size
+        self.progress_bar.update(size)
+        return size
+
+
+def _download_stream(url: str, file_path: Path, progress_bar: 'tqdm', chunk_size: int,
+                     resume_from: int = 0, if_range: Optional[str] = None) -> Tuple[str, int]:
+    """
+    Downloads `url` into `file_path` over a single connection
+
+    :param url: URL of the file
+    :param file_path: destination file
+    :param progress_bar: progress bar
+    :param chunk_size: size of the download chunk
+    :param resume_from: size of the already downloaded prefix of `file_path`, 0 to download from scratch
+    :param if_range: ETag the prefix was downloaded from, the server sends the whole file if it changed since
+    :return: sha256 hex digest and size of the downloaded file
+    """
+    headers = {}
+    if resume_from:
+        headers['Range'] = f'bytes={resume_from}-'
+        if if_range is not None:
+            headers['If-Range'] = if_range
+    resp = _session().get(url, headers=headers, stream=True)
+    resp.raise_for_status()
+    if resume_from and resp.status_code != 206:
+        logger.info("The server does not support resuming the download, starting over")
+        resume_from = 0
+        progress_bar.reset(total=progress_bar.total)
+    # the bytes are hashed as they arrive, only a resumed prefix is read back
+    digest = _hash_file(file_path) if resume_from else hashlib.sha256()
+    # the Content-Length is the size of the encoded body, it only tells the size of the file without encoding
+    expected_size = None
+    if 'content-length' in resp.headers and 'content-encoding' not in resp.headers:
+        expected_size = int(resp.headers['content-length'])
+        if not progress_bar.total:
+            progress_bar.total = resume_from + expected_size
+    # read the urllib3 stream directly, decoded like `iter_content` would
+    resp.raw.decode_content = True
+    with open(file_path, 'ab' if resume_from else 'wb') as file:
+        writer = _HashingWriter(file, digest, progress_bar)
+        shutil.copyfileobj(resp.raw, writer, length=chunk_size)
+    if expected_size is not None and writer.size != expected_size:
+        raise IOError(f"Connection closed after {writer.size} of {expected_size} bytes")
+    return digest.hexdigest(), resume_from + writer.size
+
+
+def _remote_etag(head: 'requests.Response') -> Optional[str]:
+    """
+    The `ETag` of the CDN a model is redirected to can change, the `X-Linked-Etag` of huggingface is preferred
+
+    :param head: response of the HEAD request on the model URL
+    :return: the ETag of the model or None if the server did not send one
+    """
+    for resp in (*head.history, head):
+        if 'x-linked-etag' in resp.headers:
+            return resp.headers['x-linked-etag']
+    return head.headers.get('etag')
+
+
+def _remote_size(head: 'requests.Response') -> int:
+    """
+    The `X-Linked-Size` of huggingface is the size of the model itself, whatever the CDN does with the body
+
+    :param head: response of the HEAD request on the model URL
+    :return: the size of the model in bytes, 0 if unknown
+    """
+    for resp in (*head.history, head):
+        if 'x-linked-size' in resp.headers:
+            return int(resp.headers['x-linked-size'])
+    return int(head.headers.get('content-length', 0))
+
+
+def _expected_sha256(head: 'requests.Response') -> Optional[str]:
+    """
+    Huggingface serves the sha256 of LFS files as the `X-Linked-Etag` of the (redirected) resolve response
+
+    :param head: response of the HEAD request on the model URL
+    :return: the expected sha256 hex digest of the model or None if unknown
+    """
+    for resp in (*head.history, head):
+        etag = resp.headers.get('x-linked-etag', '').strip('"')
+        if _SHA256_RE.fullmatch(etag):
+            return etag
+    return None
+
+
+def _hash_file(file_path: Path, chunk_size: int = 1 << 20) -> 'hashlib._Hash':
+    """
+    :param file_path: path of the file
+    :param chunk_size: read size
+    :return: sha256 hash object of the content of the file
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for data in iter(lambda: file.read(chunk_size), b''):
+            digest.update(data)
+    return digest
+
+
+def _is_index_entry(entry) -> bool:
+    """
+    :param entry: value of the models index
+    :return: True if `entry` has the `path` and `size` of a downloaded model
+    """
+    return (isinstance(entry, dict) and isinstance(entry.get('path'), str)
+            and isinstance(entry.get('size'), int) and not isinstance(entry.get('size'), bool))
+
+
+def _load_index() -> dict:
+    """
+    The index is only an optimization, a missing or unreadable one behaves like an empty one,
+    and a malformed entry like a missing one
+
+    :return: the content of `MODELS_INDEX_PATH`
+    """
+    try:
+        with open(MODELS_INDEX_PATH) as file:
+            index = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read the models index {MODELS_INDEX_PATH}: {e}")
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {name: entry for name, entry in index.items() if _is_index_entry(entry)}
+
+
+def _save_index(index: dict) -> None:
+    """
+    Atomically replaces `MODELS_INDEX_PATH` with `index`
+    Failures are only logged, e.g. a read-only user data directory must not fail a download to another directory
+
+    :param index: models index
+    :return: None
+    """
+    tmp_path = MODELS_INDEX_PATH.with_name(MODELS_INDEX_PATH.name + '.tmp')
+    try:
+        os.makedirs(MODELS_INDEX_PATH.parent, exist_ok=True)
+        with open(tmp_path, 'w') as file:
+            json.dump(index, file, indent=2)
+        tmp_path.replace(MODELS_INDEX_PATH)
+    except OSError as e:
+        logger.warning(f"Could not update the models index {MODELS_INDEX_PATH}: {e}")
+
+
+def _has_size(file_path: Path, size: Optional[int]) -> bool:
+    """
+    :param file_path: path of the file
+    :param size: expected size of the file
+    :return: True if `file_path` is a file of exactly `size` bytes
+    """
+    try:
+        return os.stat(file_path).st_size == size
+    except OSError:
+        return False
+
+
+def _load_part_state(state_path: Path) -> dict:
+    """
+    The state of a partial download: the `etag` of the revision it belongs to and, for a parallel download,
+    the [offset, end] of its unfinished `ranges`
+    A missing or unreadable state behaves like an empty one, the partial file is then never resumed
+
+    :param state_path: path of the state file
+    :return: the content of `state_path`
+    """
+    try:
+        with open(state_path) as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _pending_ranges(state: dict, total: int) -> Optional[List[List[int]]]:
+    """
+    :param state: state of a partial parallel download, see `_load_part_state`
+    :param total: size of the file in bytes
+    :return: the [offset, end] of the ranges left to download, None if the state does not describe valid ranges
+    """
+    ranges = state.get('ranges')
+    if not isinstance(ranges, list):
+        return None
+    pending = []
+    for byte_range in ranges:
+        if not (isinstance(byte_range, list) and len(byte_range) == 2
+                and all(isinstance(value, int) for value in byte_range)):
+            return None
+        offset, end = byte_range
+        if not 0 <= offset <= end + 1 <= total:
+            return None
+        if offset <= end:
+            pending.append([offset, end])
+    return pending
+
+
+def download_model(model_name: str, download_dir=None, chunk_size=1 << 20) -> str:
     """
     Helper function to download the `ggml` models
+    The resolved paths are memoized for the lifetime of the process, use `download_model.cache_clear()`
+    to check the models again
     :param model_name: name of the model, one of ::: constants.AVAILABLE_MODELS
     :param download_dir: Where to store the models
-    :param chunk_size: size of the download chunk
+    :param chunk_size: size of the download chunk, large chunks keep the per-chunk Python overhead negligible
 
     :return: Absolute path of the downloaded model
     """
+    # a relative directory is memoized as the absolute one it currently stands for, a later chdir resolves it again
+    if download_dir is not None:
+        download_dir = os.path.abspath(download_dir)
+    return _download_model(model_name, download_dir, chunk_size)
+
+
+@lru_cache(maxsize=32)
+def _download_model(model_name: str, download_dir, chunk_size: int) -> str:
+    """
+    Memoized implementation of `download_model`, with an absolute `download_dir`
+    """
+    import requests
+    from tqdm import tqdm
+
     if model_name not in AVAILABLE_MODELS:
         logger.error(f"Invalid model name `{model_name}`, available models are: {AVAILABLE_MODELS}")
         return
@@ -52,32 +461,118 @@ def download_model(model_name: str, download_dir=None, chunk_size=1024) -> str:
     os.makedirs(download_dir, exist_ok=True)
 
     url = _get_model_url(model_name=model_name)
-    file_path = Path(download_dir) / os.path.basename(url)
-    # check if the file is already there
-    if file_path.exists():
-        logger.info(f"Model {model_name} already exists in {download_dir}")
-    else:
-        # download it from huggingface
-        resp = requests.get(url, stream=True)
-        total = int(resp.headers.get('content-length', 0))
+    file_path = _get_model_path(model_name, download_dir)
+    index = _load_index()
+    entry = index.get(model_name)
+    if not _is_index_entry(entry):
+        entry = None
+    # check if the file is already there, or was downloaded to another directory
+    # the index doubles as the manifest of the expected sizes: a complete model is used without touching the network,
+    # a truncated one is downloaded again
+    if entry is not None:
+        indexed_path = Path(entry['path'])
+        if (indexed_path == file_path or not file_path.exists()) and _has_size(indexed_path, entry.get('size')):
+            logger.info(f"Model {model_name} already exists in {indexed_path.parent}")
+            return entry['path']
 
-        progress_bar = tqdm(desc=f"Downloading Model {model_name} ...",
-                            total=total,
-                            unit='iB',
-                            unit_scale=True,
-                            unit_divisor=1024)
+    try:
+        head = _session().head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+    except requests.RequestException as e:
+        # a model that is not in the index cannot be checked, it is trusted like before
+        if file_path.exists() and (entry is None or entry.get('path') != str(file_path)):
+            logger.info(f"Could not reach {url} ({e}), using {file_path}")
+            return str(file_path)
+        # the HEAD request is only a probe, some proxies and CDNs reject it while a plain GET works
+        logger.info(f"Could not probe {url} ({e}), downloading it over a single connection")
+        head = None
+    etag = _remote_etag(head) if head is not None else None
+    total = _remote_size(head) if head is not None else 0
+
+    if total and file_path.exists() and (entry is None or entry.get('path') != str(file_path)) \
+            and file_path.stat().st_size == total:
+        # a model downloaded before the index existed, or copied in by hand
+        logger.info(f"Model {model_name} already exists in {download_dir}")
+        index[model_name] = {'etag': etag, 'size': total, 'sha256': None, 'path': str(file_path)}
+        _save_index(index)
+        return str(file_path)
+
+    # download it from huggingface, into a sidecar file that is only renamed once complete
+    part_path = file_path.with_name(file_path.name + '.part')
+    expected_sha256 = _expected_sha256(head) if head is not None else None
+    # the revision the partial file was downloaded from, a partial file of another revision is never resumed
+    part_state_path = part_path.with_name(part_path.name + '.json')
+    part_state = _load_part_state(part_state_path)
+    part_size = part_path.stat().st_size if part_path.exists() else 0
+    resumable = etag is not None and part_state.get('etag') == etag and part_size > 0
+    accept_ranges = head is not None and head.headers.get('accept-ranges') == 'bytes'
+    # a parallel download pre-sizes the file and records its unfinished ranges, a single stream leaves a prefix
+    ranges = _pending_ranges(part_state, total) if resumable and accept_ranges and part_size == total else None
+    resume_from = part_size if resumable and 'ranges' not in part_state and part_size < total else 0
+
+    def save_part_state(state):
+        if etag is None:
+            part_state_path.unlink(missing_ok=True)
+        else:
+            part_state_path.write_text(json.dumps({'etag': etag, **state}))
+
+    # the CDN compares the If-Range with its own ETag, which only works with a strong one
+    if_range = head.headers.get('etag') if head is not None else None
+    if if_range is not None and if_range.startswith('W/'):
+        if_range = None
+    use_ranges = accept_ranges and not resume_from and (ranges is not None or total >= PARALLEL_DOWNLOAD_MIN_SIZE)
+    if not use_ranges and not resume_from:
+        save_part_state({})
+    downloaded = total - sum(end - offset + 1 for offset, end in ranges) if ranges is not None else resume_from
+
+    progress_bar = tqdm(desc=f"Downloading Model {model_name} ...",
+                        initial=downloaded,
+                        total=total or None,
+                        unit='iB',
+                        unit_scale=True,
+                        unit_divisor=1024,
+                        # the bar is only drawn for interactive runs (tqdm checks its stream, which may even be None),
+                        # and redrawn at most once per second
+                        disable=None,
+                        mininterval=1.0)
 
-        try:
-            with open(file_path, 'wb') as file, progress_bar:
-                for data in resp.iter_content(chunk_size=chunk_size):
-                    size = file.write(data)
-                    progress_bar.update(size)
-            logger.info(f"Model downloaded to {file_path.absolute()}")
-        except Exception as e:
-            # error download, just remove the file
-            os.remove(file_path)
-            raise e
-    return str(file_path.absolute())
+    try:
+        with progress_bar:
+            if use_ranges:
+                try:
+                    sha256 = _download_parallel(url, part_path, total, progress_bar, chunk_size, ranges,
+                                                lambda pending: save_part_state({'ranges': pending}))
+                    size = total
+                except (requests.RequestException, OSError) as e:
+                    logger.warning(f"Parallel download failed ({e}), retrying over a single connection")
+                    progress_bar.reset(total=total)
+                    save_part_state({})
+                    sha256, size = _download_stream(url, part_path, progress_bar, chunk_size)
+            else:
+                sha256, size = _download_stream(url, part_path, progress_bar, chunk_size, resume_from, if_range)
+    except BaseException:
+        if part_state_path.exists():
+            # the next call resumes from the partial file
+            logger.warning(f"Download of model {model_name} interrupted, partial file kept at {part_path}")
+        else:
+            # without the revision it was downloaded from, the partial file is unusable
+            logger.warning(f"Download of model {model_name} interrupted")
+            part_path.unlink(missing_ok=True)
+        raise
+    # the hash was computed while downloading, a corrupted file never gets the final name
+    if expected_sha256 is not None and sha256 != expected_sha256:
+        os.remove(part_path)
+        part_state_path.unlink(missing_ok=True)
+        raise IOError(f"Checksum mismatch for the downloaded model {model_name}, please try again")
+    part_path.replace(file_path)
+    part_state_path.unlink(missing_ok=True)
+    index[model_name] = {'etag': etag, 'size': size, 'sha256': sha256, 'path': str(file_path)}
+    _save_index(index)
+    logger.info(f"Model downloaded to {file_path}")
+    return str(file_path)
+
+
+download_model.cache_clear = _download_model.cache_clear
 
 
 def to_timestamp(t: int, separator=',') -> str:
@@ -91,108 +586,105 @@ def to_timestamp(t: int, separator=',') -> str:
     :param separator: seprator between seconds and milliseconds
     :return: time representation in hh: mm: ss[separator]ms
     """
-    # logic exactly from whisper.cpp
+    sec, msec = divmod(int(t) * 10, 1000)
+    min, sec = divmod(sec, 60)
+    hr, min = divmod(min, 60)
+    return f"{hr:02d}:{min:02d}:{sec:02d}{separator}{msec:03d}"
+
 
-    msec = t * 10
-    hr = msec // (1000 * 60 * 60)
-    msec = msec - hr * (1000 * 60 * 60)
-    min = msec // (1000 * 60)
-    msec = msec - min * (1000 * 60)
-    sec = msec // 1000
-    msec = msec - sec * 1000
-    return f"{int(hr):02,.0f}:{int(min):02,.0f}:{int(sec):02,.0f}{separator}{int(msec):03,.0f}"
+def _output_path(output_file_path: str, extension: str) -> str:
+    """
+    :param output_file_path: output file path, with or without `extension`
+    :param extension: extension of the output format
+    :return: absolute path of the output file
+    """
+    if not output_file_path.endswith(extension):
+        output_file_path = output_file_path + extension
+    return os.path.abspath(output_file_path)
 
 
-def output_txt(segments: list, output_file_path: str) -> str:
+def output_txt(segments: Iterable, output_file_path: str) -> str:
     """
     Creates a raw text from a list of segments
 
     Implementation from `whisper.cpp/examples/main`
 
-    :param segments: list of segments
+    :param segments: iterable of segments
     :return: path of the file
     """
-    if not output_file_path.endswith('.txt'):
-        output_file_path = output_file_path + '.txt'
+    absolute_path = _output_path(output_file_path, '.txt')
 
-    absolute_path = Path(output_file_path).absolute()
-
-    with open(str(absolute_path), 'w') as file:
-        for seg in segments:
-            file.write(seg.text)
-            file.write('\n')
+    with open(absolute_path, 'w', buffering=1 << 20) as file:
+        file.write(''.join([f"{seg.text}\n" for seg in segments]))
     return absolute_path
 
 
-def output_vtt(segments: list, output_file_path: str) -> str:
+def output_vtt(segments: Iterable, output_file_path: str) -> str:
     """
     Creates a vtt file from a list of segments
 
     Implementation from `whisper.cpp/examples/main`
 
-    :param segments: list of segments
+    :param segments: iterable of segments
     :return: path of the file
 
     :return: Absolute path of the file
     """
-    if not output_file_path.endswith('.vtt'):
-        output_file_path = output_file_path + '.vtt'
-
-    absolute_path = Path(output_file_path).absolute()
+    absolute_path = _output_path(output_file_path, '.vtt')
 
-    with open(absolute_path, 'w') as file:
-        file.write("WEBVTT\n\n")
-        for seg in segments:
-            file.write(f"{to_timestamp(seg.t0, separator='.')} --> {to_timestamp(seg.t1, separator='.')}\n")
-            file.write(f"{seg.text}\n\n")
+    with open(absolute_path, 'w', buffering=1 << 20) as file:
+        file.write(''.join([_VTT_HEADER, *[_VTT_BLOCK % (to_timestamp(seg.t0, '.'), to_timestamp(seg.t1, '.'), seg.text)
+                                           for seg in segments]]))
     return absolute_path
 
 
-def output_srt(segments: list, output_file_path: str) -> str:
+def output_srt(segments: Iterable, output_file_path: str) -> str:
     """
     Creates a srt file from a list of segments
 
-    :param segments: list of segments
+    :param segments: iterable of segments
     :return: path of the file
 
     :return: Absolute path of the file
     """
-    if not output_file_path.endswith('.srt'):
-        output_file_path = output_file_path + '.srt'
-
-    absolute_path = Path(output_file_path).absolute()
+    absolute_path = _output_path(output_file_path, '.srt')
 
-    with open(absolute_path, 'w') as file:
-        for i in range(len(segments)):
-            seg = segments[i]
-            file.write(f"{i+1}\n")
-            file.write(f"{to_timestamp(seg.t0, separator=',')} --> {to_timestamp(seg.t1, separator=',')}\n")
-            file.write(f"{seg.text}\n\n")
+    with open(absolute_path, 'w', buffering=1 << 20) as file:
+        file.write(''.join([_SRT_BLOCK % (i, to_timestamp(seg.t0, ','), to_timestamp(seg.t1, ','), seg.text)
+                            for i, seg in enumerate(segments, start=1)]))
     return absolute_path
 
 
-def output_csv(segments: list, output_file_path: str) -> str:
+def output_csv(segments: Iterable, output_file_path: str) -> str:
     """
     Creates a srt file from a list of segments
 
-    :param segments: list of segments
+    :param segments: iterable of segments
     :return: path of the file
 
     :return: Absolute path of the file
     """
-    if not output_file_path.endswith('.csv'):
-        output_file_path = output_file_path + '.csv'
+    absolute_path = _output_path(output_file_path, '.csv')
 
-    absolute_path = Path(output_file_path).absolute()
-
-    with open(absolute_path, 'w') as file:
-        for seg in segments:
-            file.write(f"{10 * seg.t0}, {10 * seg.t1}, \"{seg.text}\"\n")
+    with open(absolute_path, 'w', newline='', buffering=1 << 20) as file:
+        # numbers are left bare and the text is always quoted, with its own quotes escaped
+        writer = csv.writer(file, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+        writer.writerows((10 * seg.t0, 10 * seg.t1, seg.text) for seg in segments)
     return absolute_path
 
 
+@lru_cache(maxsize=1)
+def _devnull_fd() -> int:
+    """
+    :return: a write-only file descriptor on devnull, opened once and shared by all the `redirect_stderr` calls
+    """
+    fd = os.open(os.devnull, os.O_WRONLY)
+    atexit.register(os.close, fd)
+    return fd
+
+
 @contextlib.contextmanager
-def redirect_stderr(to: bool | TextIO | str | None = False) -> None:
+def redirect_stderr(to: bool | TextIO | str | int | None = False) -> None:
     """
     Redirect stderr to the specified target.
 
@@ -200,6 +692,7 @@ def redirect_stderr(to: bool | TextIO | str | None = False) -> None:
         - None to suppress output (redirect to devnull),
         - sys.stdout to redirect to stdout,
         - A file path (str) to redirect to a file,
+        - A file descriptor (int) to redirect to it,
         - False to do nothing (no redirection).
     """
 
@@ -211,15 +704,16 @@ def redirect_stderr(to: bool | TextIO | str | None = False) -> None:
     def _resolve_target(target):
         opened_stream = None
         if target is None:
-            opened_stream = open(os.devnull, "w")
-            return opened_stream, True
+            return _devnull_fd(), False
+        if isinstance(target, int) and not isinstance(target, bool):
+            return target, False
         if isinstance(target, str):
             opened_stream = open(target, "w")
             return opened_stream, True
         if hasattr(target, "write"):
             return target, False
         raise ValueError(
-            "Invalid `to` parameter; expected None, a filepath string, or a file-like object."
+            "Invalid `to` parameter; expected None, a filepath string, a file descriptor or a file-like object."
         )
 
     sys.stderr.flush()
@@ -231,10 +725,10 @@ def redirect_stderr(to: bool | TextIO | str | None = False) -> None:
 
     stream, should_close = _resolve_target(to)
 
-    if original_fd is not None and hasattr(stream, "fileno"):
+    if original_fd is not None and (isinstance(stream, int) or hasattr(stream, "fileno")):
         saved_fd = os.dup(original_fd)
         try:
-            os.dup2(stream.fileno(), original_fd)
+            os.dup2(stream if isinstance(stream, int) else stream.fileno(), original_fd)
             yield
         finally:
             os.dup2(saved_fd, original_fd)
@@ -244,6 +738,8 @@ def redirect_stderr(to: bool | TextIO | str | None = False) -> None:
         return
 
     # Fallback: Python-level redirect
+    if isinstance(stream, int):
+        stream, should_close = os.fdopen(stream, "w", closefd=False), True
     try:
         with contextlib.redirect_stderr(stream):
             yield
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test utils.py
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from collections import namedtuple
+from unittest import TestCase, mock
+
+import requests
+
+from pywhispercpp import utils
+from pywhispercpp.utils import to_timestamp
+
+
+class TestTimestamps(TestCase):
+
+    def test_to_timestamp(self):
+        self.assertEqual(to_timestamp(376), '00:00:03,760')
+        self.assertEqual(to_timestamp(1344), '00:00:13,440')
+        self.assertEqual(to_timestamp(366000, separator='.'), '01:01:00.000')
+
+
+Segment = namedtuple('Segment', ('t0', 't1', 'text'))
+
+
+class TestOutput(TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = Path(tmp_dir.name)
+
+    def test_output_srt(self):
+        segments = [Segment(0, 376, 'Hello'), Segment(376, 1344, 'world')]
+        path = utils.output_srt(iter(segments), str(self.dir / 'out'))
+        with open(path) as file:
+            self.assertEqual(file.read(), '1\n00:00:00,000 --> 00:00:03,760\nHello\n\n'
+                                          '2\n00:00:03,760 --> 00:00:13,440\nworld\n\n')
+
+    def test_output_csv(self):
+        segments = [Segment(0, 376, 'He said "hi", then left'), Segment(376, 1344, 'ok')]
+        path = utils.output_csv(iter(segments), str(self.dir / 'out'))
+        self.assertEqual(path, str(self.dir / 'out.csv'))
+        with open(path, newline='') as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows, [['0', '3760', 'He said "hi", then left'], ['3760', '13440', 'ok']])
+
+
+def _stderr_fd():
+    try:
+        return sys.stderr.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+@unittest.skipIf(_stderr_fd() is None, "stderr has no file descriptor to redirect")
+class TestRedirectStderr(TestCase):
+
+    def setUp(self):
+        self.stderr_fd = _stderr_fd()
+        self.original_stat = os.fstat(self.stderr_fd)
+
+    def tearDown(self):
+        stat = os.fstat(self.stderr_fd)
+        self.assertEqual((stat.st_dev, stat.st_ino), (self.original_stat.st_dev, self.original_stat.st_ino))
+
+    def test_devnull(self):
+        devnull = os.stat(os.devnull)
+        for _ in range(2):
+            with utils.redirect_stderr(None):
+                stat = os.fstat(self.stderr_fd)
+                self.assertEqual((stat.st_dev, stat.st_ino), (devnull.st_dev, devnull.st_ino))
+                os.write(self.stderr_fd, b'hidden\n')
+        # the devnull descriptor is shared and stays open
+        os.fstat(utils._devnull_fd())
+
+    def test_file_descriptor(self):
+        with tempfile.TemporaryFile() as file:
+            for _ in range(2):
+                with utils.redirect_stderr(file.fileno()):
+                    os.write(self.stderr_fd, b'redirected\n')
+            # the descriptor belongs to the caller, it is not closed
+            file.seek(0)
+            self.assertEqual(file.read(), b'redirected\n' * 2)
+
+
+class _FakeRaw(io.BytesIO):
+    decode_content = False
+
+
+class _FakeResponse:
+
+    def __init__(self, status_code=200, headers=None, body=b'', history=(), delay=0):
+        self.status_code = status_code
+        self.delay = delay
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.history = list(history)
+        self.raw = _FakeRaw(body)
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def _read(self, chunk_size):
+        time.sleep(self.delay)
+        return self.raw.read(chunk_size)
+
+    def iter_content(self, chunk_size=1):
+        return iter(lambda: self._read(chunk_size), b'')
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """
+    Serves `body` like huggingface does: the resolve URL redirects with the `X-Linked-*` headers
+    to a CDN which honors range requests if `ranges` is set, HEAD requests fail with `head_status` if set,
+    the range starting at `failing_range` raises `error` and the other ones are sent in chunks taking `delay` seconds
+    """
+
+    def __init__(self, body, etag='"rev-1"', ranges=True, online=True, head_status=None, sha256=None,
+                 failing_range=None, error=requests.ConnectionError, delay=0):
+        self.body = body
+        self.etag = etag
+        self.linked_etag = f'"{sha256}"' if sha256 else etag
+        self.ranges = ranges
+        self.online = online
+        self.head_status = head_status
+        self.failing_range = failing_range
+        self.error = error
+        self.delay = delay
+        self.requests = []
+        self.responses = []
+
+    def _check_online(self):
+        if not self.online:
+            raise requests.ConnectionError("offline")
+
+    def _redirect(self):
+        return _FakeResponse(302, {'X-Linked-Etag': self.linked_etag, 'X-Linked-Size': str(len(self.body))})
+
+    def head(self, url, **kwargs):
+        self._check_online()
+        self.requests.append(('HEAD', {}))
+        if self.head_status is not None:
+            return _FakeResponse(self.head_status)
+        headers = {'Content-Length': str(len(self.body)), 'ETag': self.etag}
+        if self.ranges:
+            headers['Accept-Ranges'] = 'bytes'
+        return _FakeResponse(200, headers, history=[self._redirect()])
+
+    def get(self, url, headers=None, **kwargs):
+        self._check_online()
+        headers = headers or {}
+        self.requests.append(('GET', dict(headers)))
+        if 'Range' in headers and self.ranges and headers.get('If-Range', self.etag) == self.etag:
+            start, _, end = headers['Range'][len('bytes='):].partition('-')
+            if int(start) == self.failing_range:
+                raise self.error("connection reset")
+            data = self.body[int(start):int(end) + 1 if end else None]
+            resp = _FakeResponse(206, {'Content-Length': str(len(data)), 'ETag': self.etag}, data,
+                                 history=[self._redirect()], delay=self.delay)
+            self.responses.append(resp)
+            return resp
+        return _FakeResponse(200, {'Content-Length': str(len(self.body)), 'ETag': self.etag}, self.body,
+                             history=[self._redirect()])
+
+
+class TestDownloadModel(TestCase):
+    model_name = 'tiny'
+    body = bytes(range(256)) * 1024
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = Path(tmp_dir.name)
+        self.patch('MODELS_INDEX_PATH', self.dir / 'user_data' / '_index.json')
+        self.addCleanup(utils.download_model.cache_clear)
+
+    def patch(self, name, value):
+        patcher = mock.patch.object(utils, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def serve(self, **kwargs) -> FakeSession:
+        session = FakeSession(self.body, **kwargs)
+        self.patch('_session', lambda: session)
+        return session
+
+    def download(self, download_dir='models') -> Path:
+        utils.download_model.cache_clear()
+        return Path(utils.download_model(self.model_name, str(self.dir / download_dir), chunk_size=4096))
+
+    def part_path(self) -> Path:
+        path = self.dir / 'models' / 'ggml-tiny.bin.part'
+        path.parent.mkdir(exist_ok=True)
+        return path
+
+    def state_path(self) -> Path:
+        return self.part_path().with_name('ggml-tiny.bin.part.json')
+
+    def test_parallel_download(self):
+        self.patch('PARALLEL_DOWNLOAD_MIN_SIZE', 0)
+        session = self.serve(sha256=hashlib.sha256(self.body).hexdigest())
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        ranges = [headers['Range'] for method, headers in session.requests if method == 'GET']
+        self.assertEqual(len(ranges), utils.PARALLEL_DOWNLOAD_CONNECTIONS)
+        self.assertFalse(self.part_path().exists())
+
+    def test_parallel_download_failure(self):
+        self.patch('PARALLEL_DOWNLOAD_MIN_SIZE', 0)
+        self.patch('PARALLEL_DOWNLOAD_RETRIES', 1)
+        session = self.serve(failing_range=0, delay=0.05)
+        path = self.download()
+        # the other ranges were abandoned, and the file was downloaded again in a single request
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertEqual(len(session.responses), utils.PARALLEL_DOWNLOAD_CONNECTIONS - 1)
+        for resp in session.responses:
+            self.assertLess(resp.raw.tell(), len(resp.raw.getvalue()))
+        self.assertNotIn('Range', session.requests[-1][1])
+
+    def test_resume(self):
+        part_path = self.part_path()
+        part_path.write_bytes(self.body[:1000])
+        sha256 = hashlib.sha256(self.body).hexdigest()
+        # the prefix is tagged with the huggingface ETag, the If-Range carries the one of the CDN
+        self.state_path().write_text(json.dumps({'etag': f'"{sha256}"'}))
+        session = self.serve(sha256=sha256)
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertEqual(session.requests[-1][1], {'Range': 'bytes=1000-', 'If-Range': '"rev-1"'})
+
+    def test_resume_without_range_support(self):
+        part_path = self.part_path()
+        part_path.write_bytes(self.body[:1000])
+        self.state_path().write_text(json.dumps({'etag': '"rev-1"'}))
+        self.patch('PARALLEL_DOWNLOAD_MIN_SIZE', 0)
+        session = self.serve(ranges=False)
+        path = self.download()
+        # the server answered 200 with the whole file, which replaced the prefix
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertEqual([method for method, _ in session.requests], ['HEAD', 'GET'])
+
+    def test_truncated_model(self):
+        session = self.serve()
+        path = self.download()
+        path.write_bytes(self.body[:1000])
+        self.assertEqual(self.download(), path)
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertEqual([method for method, _ in session.requests], ['HEAD', 'GET', 'HEAD', 'GET'])
+
+    def test_model_in_other_directory(self):
+        session = self.serve()
+        path = self.download('models')
+        self.assertEqual(self.download('other'), path)
+        self.assertEqual(len(session.requests), 2)
+        self.assertFalse((self.dir / 'other' / path.name).exists())
+
+    def test_relative_download_dir(self):
+        self.serve()
+        self.addCleanup(os.chdir, os.getcwd())
+        (self.dir / 'a').mkdir()
+        # the model is already in the second directory
+        (self.dir / 'b' / 'models').mkdir(parents=True)
+        (self.dir / 'b' / 'models' / 'ggml-tiny.bin').write_bytes(self.body)
+        paths = []
+        for cwd in ('a', 'b'):
+            os.chdir(self.dir / cwd)
+            # the memoized path follows the working directory
+            paths.append(utils.download_model(self.model_name, 'models', chunk_size=4096))
+        self.assertEqual(paths, [str((self.dir / cwd / 'models' / 'ggml-tiny.bin').absolute()) for cwd in ('a', 'b')])
+
+    def test_offline(self):
+        path = self.dir / 'models' / 'ggml-tiny.bin'
+        path.parent.mkdir()
+        path.write_bytes(self.body)
+        self.serve(online=False)
+        self.assertEqual(self.download(), path)
+
+    def test_offline_without_model(self):
+        self.serve(online=False)
+        with self.assertRaises(requests.ConnectionError):
+            self.download()
+
+    def test_checksum_mismatch(self):
+        self.serve(sha256='0' * 64)
+        with self.assertRaises(IOError):
+            self.download()
+        self.assertFalse(self.part_path().exists())
+        self.assertFalse((self.dir / 'models' / 'ggml-tiny.bin').exists())
+
+    def test_unwritable_index(self):
+        # the parent of the index is a file, so the index can never be written
+        (self.dir / 'user_data').write_bytes(b'')
+        self.serve()
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        # the second call adopts the file, and fails to index it again
+        self.assertEqual(self.download(), path)
+
+    def test_malformed_index(self):
+        session = self.serve()
+        path = self.download()
+        for entry in ({}, 'x', {'path': None, 'size': len(self.body)}, {'path': str(path), 'size': '262144'}):
+            with self.subTest(entry=entry):
+                utils.MODELS_INDEX_PATH.write_text(json.dumps({self.model_name: entry}))
+                session.requests.clear()
+                # the entry is ignored, the model is checked against the server again
+                self.assertEqual(self.download(), path)
+                self.assertEqual([method for method, _ in session.requests], ['HEAD'])
+
+    def test_head_rejected(self):
+        session = self.serve(head_status=405)
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertEqual([method for method, _ in session.requests], ['HEAD', 'GET'])
+        # the size of the GET is indexed, the next call does not need the network
+        session.online = False
+        self.assertEqual(self.download(), path)
+
+    def test_resume_other_revision(self):
+        self.part_path().write_bytes(b'old revision')
+        self.state_path().write_text(json.dumps({'etag': '"rev-0"'}))
+        session = self.serve()
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        self.assertNotIn('Range', session.requests[-1][1])
+        self.assertFalse(self.state_path().exists())
+
+    def test_resume_parallel_download(self):
+        self.patch('PARALLEL_DOWNLOAD_MIN_SIZE', 0)
+        session = self.serve(failing_range=0, error=KeyboardInterrupt)
+        with self.assertRaises(KeyboardInterrupt):
+            self.download()
+        # the pre-sized partial file is kept along with the unfinished ranges
+        self.assertEqual(self.part_path().stat().st_size, len(self.body))
+        state = json.loads(self.state_path().read_text())
+        self.assertEqual(state['etag'], '"rev-1"')
+        range_size = len(self.body) // utils.PARALLEL_DOWNLOAD_CONNECTIONS
+        self.assertEqual(state['ranges'][0], [0, range_size - 1])
+        session.failing_range = None
+        session.requests.clear()
+        path = self.download()
+        self.assertEqual(path.read_bytes(), self.body)
+        ranges = [headers.get('Range') for method, headers in session.requests if method == 'GET']
+        self.assertIn(f'bytes=0-{range_size - 1}', ranges)
+        self.assertNotIn(None, ranges)
+        self.assertFalse(self.state_path().exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
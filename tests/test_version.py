@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test _version.py
+"""
+import subprocess
+import sys
+import unittest
+from unittest import TestCase
+
+import pywhispercpp
+from pywhispercpp import _version
+
+
+class TestVersion(TestCase):
+
+    def test_version_tuple_release(self):
+        return self.assertEqual(_version._version_tuple('1.3.1'), (1, 3, 1))
+
+    def test_version_tuple_local(self):
+        return self.assertEqual(_version._version_tuple('1.3.1.dev4+g1a2b3c4d.d20240101'),
+                                (1, 3, 1, 'dev4', 'g1a2b3c4d', 'd20240101'))
+
+    def test_version_tuple_empty_tokens(self):
+        return self.assertEqual(_version._version_tuple('1..2+'), (1, 2))
+
+    def test_commit_id(self):
+        return self.assertEqual(_version._commit_id('1.3.1.dev4+g1a2b3c4d.d20240101'), 'g1a2b3c4d')
+
+    def test_commit_id_release(self):
+        return self.assertEqual(_version._commit_id('1.3.1'), '')
+
+    def test_commit_id_short_node(self):
+        return self.assertEqual(_version._commit_id('1.3.1+gabc'), '')
+
+    def test_lazy_attributes(self):
+        self.assertIsInstance(_version.__version__, str)
+        self.assertIsInstance(_version.version_tuple, tuple)
+        self.assertIsInstance(_version.commit_id, str)
+        return self.assertIn('__commit_id__', dir(_version))
+
+    def test_package_attributes(self):
+        self.assertEqual(pywhispercpp._VERSION_ATTRS, frozenset(_version.__all__))
+        return self.assertEqual(pywhispercpp.__version__, _version.__version__)
+
+    def test_package_import_is_lazy(self):
+        code = "import sys, pywhispercpp; print('pywhispercpp._version' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        return self.assertEqual(output.strip(), 'False')
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            _version.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()